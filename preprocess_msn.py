@@ -1,15 +1,43 @@
 import argparse
+import codecs
 import json
 import re
 import os
-from bs4 import BeautifulSoup
+import functools
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from bs4 import MarkupResemblesLocatorWarning
-import warnings
-
-# Ignore the MarkupResemblesLocatorWarning as we are parsing HTML snippets
-warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
-
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Patterns used for every participant and message, compiled once
+_SUFFIX_RE = re.compile(r'\s*[-—].*|\s*\[.*?\]|\s*\([^)]+\)|\s*:\s*$')
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+_DATE_RE = re.compile(r'\d{1,2} \w+ \d{4}')
+_EMAIL_PAREN_RE = re.compile(r'\(([^)]+@[^)]+\.[^)]+)\)')
+
+# French month names found in session headers, translated in a single pass
+_FR_MONTHS = {
+    'janvier': 'January', 'février': 'February', 'mars': 'March',
+    'avril': 'April', 'mai': 'May', 'juin': 'June',
+    'juillet': 'July', 'août': 'August', 'septembre': 'September',
+    'octobre': 'October', 'novembre': 'November', 'décembre': 'December'
+}
+_FR_MONTH_RE = re.compile('|'.join(map(re.escape, _FR_MONTHS)))
+# English month numbers, keyed lowercased since month names are matched case-insensitively
+_EN_MONTHS = {en.lower(): number for number, en in enumerate(_FR_MONTHS.values(), 1)}
+
+# Lowercased starts of messages that are links or system prompts rather than chat
+_SKIPPED_MESSAGE_PREFIXES = ("http://", "https://", "ping? [request]")
+
+@functools.lru_cache(maxsize=4096)
 def clean_display_name(display_name_text):
     """
     Cleans and normalizes a display name by removing common chat client suffixes,
@@ -18,221 +46,358 @@ def clean_display_name(display_name_text):
     # Remove HTML entities like &lt; and &gt;
     cleaned = display_name_text.replace('&lt;', '<').replace('&gt;', '>').strip()
     # Remove common suffixes (e.g., ' - ...', ' [...]', ' (...)', ' :')
-    cleaned = re.sub(r'\s*[-—].*|\s*\[.*?\]|\s*\([^)]+\)|\s*:\s*$', '', cleaned).strip()
+    cleaned = _SUFFIX_RE.sub('', cleaned).strip()
     # Remove any lingering special characters or non-alphanumeric that aren't part of core names
-    cleaned = re.sub(r'[^\w\s]', '', cleaned).strip()
+    cleaned = _NONWORD_RE.sub('', cleaned).strip()
     # Replace sequences of whitespace with a single space
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip().lower()
+    cleaned = _WS_RE.sub(' ', cleaned).strip().lower()
     return cleaned
 
-def html_to_json(html_file_path, json_file_path, user_identifier):
+@functools.lru_cache(maxsize=4096)
+def _name_variants(display_name_text):
     """
-    Converts an HTML chat log file into a JSON format suitable for AI training.
-    Messages from the 'user_identifier' are marked as 'gpt', others as 'human'.
+    Returns the increasingly cleaned versions of a display name used as participant
+    map keys: lowercased, fully cleaned, and the first word of the cleaned name.
     """
-    print(f"DEBUG: Processing file: {html_file_path}")
-    conversations = []
-
-    try:
-        # Open file with specific UTF-16LE encoding for MSN logs
-        with open(html_file_path, 'r', encoding='utf-16-le') as file:
-            soup = BeautifulSoup(file, 'html.parser')
-    except Exception as e:
-        print(f"ERROR: Could not open or parse {html_file_path}: {e}")
-        return
+    cleaned = clean_display_name(display_name_text)
+    return display_name_text.lower(), cleaned, cleaned.partition(' ')[0]
 
-    sessions = soup.find_all('div', class_='mplsession')
-    print(f"DEBUG: Found {len(sessions)} sessions in {html_file_path}")
-
-    for session_idx, session in enumerate(sessions):
-        # Extract session date
-        session_date_tag = session.find('h2')
-        session_date = "UNKNOWN_DATE"
-        if session_date_tag:
-            date_str_match = re.search(r'\d{1,2} \w+ \d{4}', session_date_tag.get_text())
-            if date_str_match:
-                date_part = date_str_match.group(0)
-                # Map French month names to English for datetime parsing
-                french_months = {
-                    'janvier': 'January', 'février': 'February', 'mars': 'March',
-                    'avril': 'April', 'mai': 'May', 'juin': 'June',
-                    'juillet': 'July', 'août': 'August', 'septembre': 'September',
-                    'octobre': 'October', 'novembre': 'November', 'décembre': 'December'
-                }
-                for fr, en in french_months.items():
-                    date_part = date_part.replace(fr, en)
-                try:
-                    session_date = datetime.strptime(date_part, '%d %B %Y').strftime('%y.%m.%d')
-                except ValueError:
-                    print(f"Warning: Could not parse session date '{date_part}' in file {html_file_path}. Using UNKNOWN_DATE.")
-
-        # Build a canonical map of known display names to primary identifiers (e.g., email IDs)
-        # This map will store {normalized_display_name_from_header: primary_identifier, ...}
-        canonical_participant_map = {} 
-        
-        participants_list = session.find('ul')
-        if participants_list:
-            for li in participants_list.find_all('li'):
-                full_li_text = li.get_text(strip=True)
-                # Try to extract the primary identifier (e.g., email address) from parentheses
-                identifier_match = re.search(r'\(([^)]+@[^)]+\.[^)]+)\)', full_li_text)
-                
-                primary_identifier = None
-                if identifier_match:
-                    primary_identifier = identifier_match.group(1).lower()
-                    
-                    # Extract the display name part before the identifier
-                    display_name_part = full_li_text.replace(f'({identifier_match.group(1)})', '').strip()
-                    
-                    # Store multiple, increasingly cleaned versions of the display name
-                    # These will be the keys for our canonical_participant_map
-                    
-                    # 1. Very light cleaning: just remove surrounding whitespace
-                    name_v1 = display_name_part.lower()
-                    if name_v1 and name_v1 not in canonical_participant_map:
-                        canonical_participant_map[name_v1] = primary_identifier
-
-                    # 2. More aggressive cleaning: remove suffixes and special characters
-                    name_v2 = clean_display_name(display_name_part)
-                    if name_v2 and name_v2 not in canonical_participant_map:
-                        canonical_participant_map[name_v2] = primary_identifier
-                    
-                    # 3. First word only (e.g., "User", "Friend")
-                    name_v3 = name_v2.split(' ')[0] if name_v2 else ''
-                    if name_v3 and name_v3 not in canonical_participant_map:
-                        canonical_participant_map[name_v3] = primary_identifier
-                else:
-                    # Fallback for participants without explicit identifier in header (less common but for robustness)
-                    cleaned_name = clean_display_name(full_li_text)
-                    if cleaned_name and cleaned_name not in canonical_participant_map:
-                        canonical_participant_map[cleaned_name] = cleaned_name # Use name as pseudo-identifier
-
-        print(f"DEBUG: Session {session_idx+1} Canonical Participant Map: {canonical_participant_map}")
-
-        message_rows = session.find_all('tr')
-        session_conversations = []
+def _has_class(el, class_name):
+    """
+    Returns whether class_name is one of the CSS classes of an element.
+    """
+    classes = el.get('class')
+    if not classes:
+        return False
+    # Only split the attribute into a list when the name appears in it but is not the only class
+    return classes == class_name or (class_name in classes and class_name in classes.split())
 
-        for row_idx, row in enumerate(message_rows):
-            # Skip rows that represent status changes or other non-message events
-            if 'msgplus' in row.get('class', []):
-                continue
+def _get_text(el, separator=''):
+    """
+    Returns the text of an element, stripping each piece of text, dropping the
+    empty ones and joining the rest with separator.
+    """
+    return separator.join(filter(None, map(str.strip, el.itertext())))
 
-            time_tag = row.find('span', class_='time')
-            sender_th = row.find('th')
-            content_td = row.find('td')
-
-            if time_tag and sender_th and content_td:
-                # Extract and format timestamp
-                time_str = time_tag.get_text(strip=True).replace('(', '').replace(')', '')
-                if len(time_str.split(':')) == 2: # Add dummy seconds if missing
-                    time_str += ':00'
-                full_timestamp = f"{session_date}, {time_str}"
-
-                # Extract sender's display name from the <th> tag, accounting for inner HTML spans
-                sender_th_clone = sender_th.decode_contents() # Get inner HTML
-                # Remove the time span HTML from the string before parsing with BS again
-                time_span_html = str(time_tag)
-                sender_display_name_raw = sender_th_clone.replace(time_span_html, '', 1).strip()
-                
-                # Use BeautifulSoup to get pure text from the potentially HTML-rich sender name
-                sender_display_name_from_msg = BeautifulSoup(sender_display_name_raw, 'html.parser').get_text(strip=True).rstrip(':').strip()
-
-                # Prepare multiple cleaned versions of the sender name from the message for matching
-                sender_name_v1 = sender_display_name_from_msg.lower()
-                sender_name_v2 = clean_display_name(sender_display_name_from_msg)
-                sender_name_v3 = sender_name_v2.split(' ')[0] if sender_name_v2 else ''
-
-                # Extract and clean message content
-                content_html = ''.join(str(c) for c in content_td.contents)
-                content_text = BeautifulSoup(content_html, 'html.parser').get_text(separator=' ', strip=True)
-
-                # Filter out messages containing only links or specific system prompts
-                if content_text.strip().lower().startswith("http://") or \
-                   content_text.strip().lower().startswith("https://") or \
-                   content_text.strip().lower().startswith("ping? [request]"):
+def _detach(el):
+    """
+    Removes an element from its parent, keeping its tail text in the tree.
+    """
+    parent = el.getparent()
+    if el.tail:
+        previous = el.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or '') + el.tail
+        else:
+            parent.text = (parent.text or '') + el.tail
+    parent.remove(el)
+
+def _find_message_cells(row):
+    """
+    Returns the time span, sender <th> and content <td> of a message row,
+    locating all three in a single walk over the row's descendants.
+    """
+    time_tag = sender_th = content_td = None
+    for el in row.iter('span', 'th', 'td'):
+        if time_tag is None and el.tag == 'span' and _has_class(el, 'time'):
+            time_tag = el
+        elif sender_th is None and el.tag == 'th':
+            sender_th = el
+        elif content_td is None and el.tag == 'td':
+            content_td = el
+        if time_tag is not None and sender_th is not None and content_td is not None:
+            break
+    return time_tag, sender_th, content_td
+
+def _iter_sessions(html_file_path):
+    """
+    Streams the mplsession <div> blocks of an MSN log, yielding each one as soon as
+    it has been parsed and freeing it once the caller is done with it, so only one
+    session is kept in memory at a time.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='div')
+    # MSN logs are UTF-16LE. They are decoded here rather than by lxml, whose HTML parser
+    # stops quietly at invalid input and would make a corrupt log look merely short
+    decoder = codecs.getincrementaldecoder('utf-16-le')()
+    with open(html_file_path, 'rb', buffering=1 << 18) as file:
+        # An empty file has no root element for lxml to find, treat it as a log without sessions
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        position = 0
+        while True:
+            chunk = file.read(1 << 18)
+            try:
+                text = decoder.decode(chunk, final=not chunk)
+            except UnicodeDecodeError as e:
+                # Report the offset of the bad bytes in the file rather than in this chunk
+                e.start += position
+                e.end += position
+                raise
+            position += len(chunk)
+            if text:
+                parser.feed(text)
+            if not chunk:
+                parser.close()
+            for _, elem in parser.read_events():
+                if not _has_class(elem, 'mplsession'):
                     continue
+                yield elem
+                # Drop the session and everything parsed before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            if not chunk:
+                break
+
+def _write_json(path, data):
+    """
+    Writes data to path as indented UTF-8 JSON, using orjson when it is installed.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
-                # --- Determine 'from' field based on identifier lookup ---
-                identified_sender_identifier = None
+def _session_to_conversations(session, session_idx, html_file_path, user_identifier_lc):
+    """
+    Extracts the messages of a single mplsession block, labelled 'gpt' when sent by
+    the user and 'human' otherwise.
+    """
+    # Extract session date
+    session_date_tag = session.find('.//h2')
+    session_date = "UNKNOWN_DATE"
+    if session_date_tag is not None:
+        date_str_match = _DATE_RE.search(''.join(session_date_tag.itertext()))
+        if date_str_match:
+            date_part = date_str_match.group(0)
+            # Map French month names to English before looking up the month number
+            date_part = _FR_MONTH_RE.sub(lambda m: _FR_MONTHS[m.group(0)], date_part)
+            day, month, year = date_part.split(' ')
+            try:
+                session_date = datetime(int(year), _EN_MONTHS[month.lower()], int(day)).strftime('%y.%m.%d')
+            except (KeyError, ValueError):
+                print(f"Warning: Could not parse session date '{date_part}' in file {html_file_path}. Using UNKNOWN_DATE.")
+
+    # Build a canonical map of known display names to primary identifiers (e.g., email IDs)
+    # This map will store {normalized_display_name_from_header: primary_identifier, ...}
+    canonical_participant_map = {} 
+    
+    participants_list = session.find('.//ul')
+    if participants_list is not None:
+        for li in participants_list.findall('.//li'):
+            full_li_text = _get_text(li)
+            # Try to extract the primary identifier (e.g., email address) from parentheses
+            identifier_match = _EMAIL_PAREN_RE.search(full_li_text)
+            
+            primary_identifier = None
+            if identifier_match:
+                primary_identifier = identifier_match.group(1).lower()
+                
+                # Extract the display name part before the identifier
+                display_name_part = full_li_text.replace(f'({identifier_match.group(1)})', '').strip()
+                
+                # Store multiple, increasingly cleaned versions of the display name
+                # These will be the keys for our canonical_participant_map
+                for name in _name_variants(display_name_part):
+                    if name and name not in canonical_participant_map:
+                        canonical_participant_map[name] = primary_identifier
+            else:
+                # Fallback for participants without explicit identifier in header (less common but for robustness)
+                cleaned_name = clean_display_name(full_li_text)
+                if cleaned_name and cleaned_name not in canonical_participant_map:
+                    canonical_participant_map[cleaned_name] = cleaned_name # Use name as pseudo-identifier
+
+    log.debug("Session %d Canonical Participant Map: %s", session_idx + 1, canonical_participant_map)
+
+    message_rows = session.findall('.//tr')
+    session_conversations = []
+    # Results of the substring fallback, so the scan over all participants runs once per unmatched name
+    substring_match_cache = {}
+
+    for row_idx, row in enumerate(message_rows):
+        # Skip rows that represent status changes or other non-message events
+        if _has_class(row, 'msgplus'):
+            continue
+
+        time_tag, sender_th, content_td = _find_message_cells(row)
+
+        if time_tag is not None and sender_th is not None and content_td is not None:
+            # Extract and format timestamp
+            time_str = _get_text(time_tag).replace('(', '').replace(')', '')
+            if time_str.count(':') == 1: # Add dummy seconds if missing
+                time_str += ':00'
+            full_timestamp = f"{session_date}, {time_str}"
+
+            # Extract sender's display name from the <th> tag, accounting for inner HTML spans
+            # The time span has already been read, detach it so only the name text remains
+            _detach(time_tag)
+            sender_display_name_from_msg = _get_text(sender_th).rstrip(':').strip()
+
+            # Prepare multiple cleaned versions of the sender name from the message for matching
+            sender_name_v1, sender_name_v2, sender_name_v3 = _name_variants(sender_display_name_from_msg)
+
+            # Extract and clean message content
+            content_text = _get_text(content_td, separator=' ')
+
+            # Filter out messages containing only links or specific system prompts
+            # (_get_text already stripped the content)
+            if content_text.lower().startswith(_SKIPPED_MESSAGE_PREFIXES):
+                continue
 
-                # Prioritize matching cleaned versions of the sender's name from the message
-                if sender_name_v2 in canonical_participant_map:
-                    identified_sender_identifier = canonical_participant_map[sender_name_v2]
-                elif sender_name_v3 in canonical_participant_map:
-                    identified_sender_identifier = canonical_participant_map[sender_name_v3]
-                elif sender_name_v1 in canonical_participant_map: # Check raw lowecased version
-                    identified_sender_identifier = canonical_participant_map[sender_name_v1]
+            # --- Determine 'from' field based on identifier lookup ---
+            # Prioritize matching cleaned versions of the sender's name from the message,
+            # then the raw lowercased version (identifiers in the map are never empty)
+            identified_sender_identifier = (canonical_participant_map.get(sender_name_v2)
+                                            or canonical_participant_map.get(sender_name_v3)
+                                            or canonical_participant_map.get(sender_name_v1))
+            if identified_sender_identifier is None:
+                if sender_name_v2 in substring_match_cache:
+                    identified_sender_identifier = substring_match_cache[sender_name_v2]
                 else:
                     # Fallback to broader substring matching if direct clean matches fail
                     for canonical_name, identifier_in_map in canonical_participant_map.items():
                         if canonical_name in sender_name_v2 or sender_name_v2 in canonical_name:
                             identified_sender_identifier = identifier_in_map
-                            break 
+                            break
+                    substring_match_cache[sender_name_v2] = identified_sender_identifier
 
-                from_field = "human" # Default label for other participants
-                if identified_sender_identifier and user_identifier.lower() == identified_sender_identifier.lower():
-                    from_field = "gpt" # Label for the specified user
+            from_field = "human" # Default label for other participants
+            if identified_sender_identifier == user_identifier_lc:
+                from_field = "gpt" # Label for the specified user
 
-                print(f"DEBUG: Message sender: '{sender_display_name_from_msg}' (cleaned:'{sender_name_v2}') -> Identified ID: {identified_sender_identifier}, Label: {from_field}") 
+            log.debug("Message sender: '%s' (cleaned:'%s') -> Identified ID: %s, Label: %s",
+                      sender_display_name_from_msg, sender_name_v2, identified_sender_identifier, from_field)
 
-                session_conversations.append({
-                    "from": from_field,
-                    "value": content_text
-                })
+            session_conversations.append({
+                "from": from_field,
+                "value": content_text
+            })
 
+    return session_conversations
+
+def _save_partial_conversation(json_file_path, offset, partial_conversations):
+    """
+    Saves one segment of a conversation split across multiple files, named after the
+    index of its first message.
+    """
+    if len(partial_conversations) < 3: # Skip very short segments
+        log.debug("Skipping partial conversation (length %d) as it's too short.", len(partial_conversations))
+        return
+    _write_json(json_file_path + str(offset) + ".json", {"conversations": partial_conversations})
+    log.debug("Saved %s%d.json with %d messages.", json_file_path, offset, len(partial_conversations))
+
+def html_to_json(html_file_path, json_file_path, user_identifier):
+    """
+    Converts an HTML chat log file into a JSON format suitable for AI training.
+    Messages from the 'user_identifier' are marked as 'gpt', others as 'human'.
+    """
+    log.debug("Processing file: %s", html_file_path)
+    # Messages are written out as soon as a file's worth has been collected, so at most
+    # one file's worth is held here. 'offset' is the index of the first pending message.
+    pending_conversations = []
+    offset = 0
+    total_conversations = 0
+    # Identifiers in the participant map are stored lowercased
+    user_identifier_lc = user_identifier.lower()
+    session_count = 0
+
+    sessions = _iter_sessions(html_file_path)
+    while True:
+        # Only reading and parsing the log is guarded here, output errors are not parse errors.
+        # _iter_sessions raises OSError when reading, UnicodeDecodeError from its own UTF-16LE
+        # decoder and LxmlError from the HTML parser.
+        try:
+            session = next(sessions, None)
+        except (OSError, UnicodeDecodeError, etree.LxmlError) as e:
+            print(f"ERROR: Could not open or parse {html_file_path}: {e}")
+            if offset:
+                print(f"ERROR: Kept the {offset} messages already saved to {json_file_path}*.json, the rest of the file was dropped.")
+            return
+        if session is None:
+            break
+
+        session_idx = session_count
+        session_count += 1
+        session_conversations = _session_to_conversations(session, session_idx, html_file_path, user_identifier_lc)
+        for message in session_conversations:
+            if len(pending_conversations) == 40:
+                # More than 40 messages, split into multiple files as it's too long for training
+                _save_partial_conversation(json_file_path, offset, pending_conversations)
+                offset += 40
+                pending_conversations = []
+            pending_conversations.append(message)
         if session_conversations:
-            conversations.extend(session_conversations)
-            print(f"DEBUG: Session {session_idx+1} added {len(session_conversations)} messages. Total so far: {len(conversations)}")
+            total_conversations += len(session_conversations)
+            log.debug("Session %d added %d messages. Total so far: %d", session_idx + 1, len(session_conversations), total_conversations)
 
-    print(f"DEBUG: Finished processing {html_file_path}. Total conversations: {len(conversations)}")
+    log.debug("Finished processing %s. Total sessions: %d, total conversations: %d", html_file_path, session_count, total_conversations)
 
-    # Save the conversations list to JSON file(s)
-    if len(conversations) > 40: # Split into multiple files if too long for training
-        for i in range(0, len(conversations), 40):
-            partial_conversations = conversations[i:i+40]
-            if len(partial_conversations) < 3: # Skip very short segments
-                print(f"DEBUG: Skipping partial conversation (length {len(partial_conversations)}) as it's too short.")
-                continue
-            json.dump({"conversations": partial_conversations}, open(json_file_path + str(i) + ".json", 'w', encoding='utf-8'), ensure_ascii=False, indent=4)
-            print(f"DEBUG: Saved {json_file_path}{i}.json with {len(partial_conversations)} messages.")
+    # Save the remaining conversations to JSON file(s)
+    if offset: # Last segment of a conversation already split into multiple files
+        _save_partial_conversation(json_file_path, offset, pending_conversations)
     else:
-        if len(conversations) < 3: # Skip very short complete conversations
-            print(f"DEBUG: Skipping conversation (length {len(conversations)}) as it's too short for a single file.")
+        if len(pending_conversations) < 3: # Skip very short complete conversations
+            log.debug("Skipping conversation (length %d) as it's too short for a single file.", len(pending_conversations))
             return
-        json.dump({"conversations": conversations}, open(json_file_path + ".json", 'w', encoding='utf-8'), ensure_ascii=False, indent=4)
-        print(f"DEBUG: Saved {json_file_path}.json with {len(conversations)} messages.")
+        _write_json(json_file_path + ".json", {"conversations": pending_conversations})
+        log.debug("Saved %s.json with %d messages.", json_file_path, len(pending_conversations))
 
 
-def process_folder(data_folder, output_folder, user_identifier):
+def _configure_logging(debug):
+    """
+    Enables the detailed debug output when requested. Also run in each worker
+    process, which does not inherit the logging setup under spawn or forkserver.
+    """
+    if debug:
+        logging.basicConfig(level=logging.DEBUG, format="DEBUG: %(message)s")
+
+def process_folder(data_folder, output_folder, user_identifier, debug=False):
     """
     Processes all HTML files in a given data folder and converts them to JSON.
     """
     # Create the output folder if it doesn't exist
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
-        print(f"DEBUG: Created output folder: {output_folder}")
-
-    # Process each .html file in the data folder
-    found_html_files = False
-    for filename in os.listdir(data_folder):
-        if filename.endswith('.html'):
-            found_html_files = True
-            file_path = os.path.join(data_folder, filename)
-            json_file_name = os.path.splitext(filename)[0]
-            json_file_path = os.path.join(output_folder, json_file_name)
-            print(f"Processing '{filename}'...")
-            html_to_json(file_path, json_file_path, user_identifier)
-
-    if not found_html_files:
+        log.debug("Created output folder: %s", output_folder)
+
+    # Collect each .html file in the data folder
+    file_paths = []
+    json_file_paths = []
+    with os.scandir(data_folder) as entries:
+        for entry in entries:
+            if entry.name.endswith('.html') and entry.is_file():
+                file_paths.append(entry.path)
+                json_file_name = os.path.splitext(entry.name)[0]
+                json_file_paths.append(os.path.join(output_folder, json_file_name))
+
+    if not file_paths:
         print(f"WARNING: No .html files found in '{data_folder}'. Please ensure your files are in this directory and have the '.html' extension.")
+        return
+
+    # Files are independent of each other, convert them in parallel across processes
+    print(f"Processing {len(file_paths)} files...")
+    with ProcessPoolExecutor(initializer=_configure_logging, initargs=(debug,)) as executor:
+        futures = {
+            executor.submit(html_to_json, file_path, json_file_path, user_identifier): file_path
+            for file_path, json_file_path in zip(file_paths, json_file_paths)
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(f"Processed '{os.path.basename(futures[future])}'.")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Convert chat HTML logs to JSON format for AI training.")
     parser.add_argument("user_identifier", type=str, 
                         help="Your primary identifier (e.g., email address) to label your messages as 'gpt'.")
+    parser.add_argument("--debug", action="store_true",
+                        help="Print detailed debug output while processing.")
     args = parser.parse_args()
 
+    _configure_logging(args.debug)
+
     if not args.user_identifier:
         print("Please provide a user identifier to label your messages.")
         exit()
@@ -241,4 +406,4 @@ if __name__ == "__main__":
 
     data_folder = "data/raw_data"
     output_folder = "data/preprocessed"
-    process_folder(data_folder, output_folder, args.user_identifier)
+    process_folder(data_folder, output_folder, args.user_identifier, debug=args.debug)